@@ -0,0 +1,265 @@
+import asyncio
+import gc
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+import pytest
+from aiohttp import web
+from whatsabi.client import SyncClient
+from whatsabi.concurrency import BackgroundLoop
+from whatsabi.loaders import (
+    SignatureLookup,
+    FourByteSignatureLookup,
+    SamczsunSignatureLookup,
+    MultiSignatureLookup,
+)
+
+SIGNATURES = {
+    "0x06fdde03": ["name()"],
+    "0xc45a0155": ["factory()"],
+    "0x721c20121297512b72821b97f5326877ea8ecf4bb9948fea5bfcb6453074d37f": [
+        "CounterIncremented(uint256,address)"
+    ],
+}
+
+
+class CountingSignatureLookup(SignatureLookup):
+    def __init__(self, signatures):
+        self.signatures = signatures
+        self.calls = 0
+
+    async def load_functions(self, selector, session=None):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return self.signatures[selector]
+
+    async def load_events(self, hash, session=None):
+        self.calls += 1
+        return self.signatures[hash]
+
+
+class SignatureServer:
+    """Serves samczsun and 4byte style responses on a local port."""
+
+    def __init__(self):
+        self.hits = 0
+        self.peers = set()
+        self.delay = 0.0
+
+    async def samczsun(self, request):
+        self.record(request)
+        await asyncio.sleep(self.delay)
+        kind = "function" if "function" in request.query else "event"
+        key = request.query[kind]
+        names = [{"name": name} for name in SIGNATURES.get(key, [])]
+        return web.json_response({"result": {kind: {key: names}}})
+
+    async def fourbyte(self, request):
+        self.record(request)
+        await asyncio.sleep(self.delay)
+        key = request.query["hex_signature"]
+        names = [{"text_signature": name} for name in SIGNATURES.get(key, [])]
+        return web.json_response({"results": names})
+
+    def record(self, request):
+        self.hits += 1
+        self.peers.add(request.transport.get_extra_info("peername"))
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/samczsun", self.samczsun)
+        app.router.add_get("/4byte", self.fourbyte)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = self.runner.addresses[0][1]
+        self.base_url = f"http://127.0.0.1:{port}"
+
+    def samczsun_lookup(self):
+        lookup = SamczsunSignatureLookup()
+        lookup.function_base_url = self.base_url + "/samczsun?function="
+        lookup.event_base_url = self.base_url + "/samczsun?event="
+        return lookup
+
+    def fourbyte_lookup(self):
+        lookup = FourByteSignatureLookup()
+        lookup.function_base_url = self.base_url + "/4byte?hex_signature="
+        lookup.event_base_url = self.base_url + "/4byte?hex_signature="
+        return lookup
+
+
+@pytest.fixture
+def loop():
+    loop = BackgroundLoop()
+    yield loop
+    loop.stop()
+
+
+@pytest.fixture
+def server():
+    server_loop = BackgroundLoop()
+    server = SignatureServer()
+    server_loop.run(server.start())
+    yield server
+    server_loop.run(server.runner.cleanup())
+    server_loop.stop()
+
+
+def test_sync_client_shares_cache_across_threads(loop):
+    lookup = CountingSignatureLookup(SIGNATURES)
+    with SyncClient(lookup, loop=loop) as client:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(lambda _: client.load_functions("0x06fdde03"), range(32))
+            )
+        assert results == [["name()"]] * 32
+        assert lookup.calls == 1
+
+
+def test_sync_client_cache_keys_are_case_insensitive(loop):
+    lookup = CountingSignatureLookup(SIGNATURES)
+    with SyncClient(lookup, loop=loop) as client:
+        assert client.load_functions("0x06FDDE03") == ["name()"]
+        assert client.load_functions("0x06fdde03") == ["name()"]
+        assert lookup.calls == 1
+
+
+def test_sync_client_cache_is_bounded(loop):
+    lookup = CountingSignatureLookup(SIGNATURES)
+    with SyncClient(lookup, loop=loop, max_cache_size=1) as client:
+        client.load_functions("0x06fdde03")
+        client.load_functions("0xc45a0155")
+        client.load_functions("0x06fdde03")
+        assert lookup.calls == 3
+        assert len(client._cache) == 1
+
+
+def test_sync_client_load_many(loop):
+    lookup = CountingSignatureLookup(SIGNATURES)
+    with SyncClient(lookup, loop=loop) as client:
+        assert client.load_functions_many(["0x06fdde03", "0xc45a0155"]) == {
+            "0x06fdde03": ["name()"],
+            "0xc45a0155": ["factory()"],
+        }
+
+
+def test_sync_client_does_not_cache_failures(loop):
+    lookup = CountingSignatureLookup({})
+    with SyncClient(lookup, loop=loop) as client:
+        with pytest.raises(KeyError):
+            client.load_functions("0x06fdde03")
+        lookup.signatures["0x06fdde03"] = ["name()"]
+        assert client.load_functions("0x06fdde03") == ["name()"]
+
+
+def test_sync_client_multi_lookup_pools_connections(loop, server):
+    lookup = MultiSignatureLookup([server.samczsun_lookup(), server.fourbyte_lookup()])
+    with SyncClient(lookup, loop=loop) as client:
+        assert client.load_functions("0x06fdde03") == ["name()"]
+        assert client.load_functions("0xc45a0155") == ["factory()"]
+        assert client.load_events(
+            "0x721c20121297512b72821b97f5326877ea8ecf4bb9948fea5bfcb6453074d37f"
+        ) == ["CounterIncremented(uint256,address)"]
+    # Both child lookups went through the client's session, so the six
+    # requests were served over at most two keep-alive connections.
+    assert server.hits == 6
+    assert len(server.peers) <= 2
+
+
+def test_sync_client_leaves_loaders_usable_natively(loop, server):
+    lookup = server.samczsun_lookup()
+    with SyncClient(lookup, loop=loop) as client:
+        assert client.load_functions("0x06fdde03") == ["name()"]
+        assert asyncio.run(lookup.load_functions("0x06fdde03")) == ["name()"]
+        with SyncClient(lookup, loop=loop) as other:
+            assert other.load_functions("0xc45a0155") == ["factory()"]
+        assert client.load_functions("0xc45a0155") == ["factory()"]
+
+
+def test_sync_client_timeout_keeps_shared_request(loop, server):
+    server.delay = 0.2
+    with SyncClient(server.samczsun_lookup(), loop=loop, timeout=0.01) as client:
+        with pytest.raises(TimeoutError):
+            client.load_functions("0x06fdde03")
+        client.timeout = 5
+        assert client.load_functions("0x06fdde03") == ["name()"]
+    assert server.hits == 1
+
+
+def test_sync_client_survives_loop_restart(loop, server):
+    client = SyncClient(server.samczsun_lookup(), loop=loop)
+    assert client.load_functions("0x06fdde03") == ["name()"]
+    session = client._session
+    loop.stop()
+    assert session.closed
+    assert client.load_functions("0x06fdde03") == ["name()"]
+    assert server.hits == 2
+    client.close()
+
+
+def test_sync_client_close_without_session_is_a_noop():
+    loop = BackgroundLoop()
+    SyncClient(CountingSignatureLookup(SIGNATURES), loop=loop).close()
+    assert loop._state is None
+
+
+def test_sync_client_close_ignores_lookup_timeout(loop, server):
+    client = SyncClient(server.samczsun_lookup(), loop=loop, timeout=1)
+    assert client.load_functions("0x06fdde03") == ["name()"]
+    client.timeout = 1e-9
+    client.close()
+    assert client._session is None
+
+
+def test_sync_client_lookup_queued_during_stop(loop):
+    client = SyncClient(CountingSignatureLookup(SIGNATURES), loop=loop)
+    errors = []
+
+    def lookup():
+        try:
+            client.load_functions("0x06fdde03")
+        except Exception as error:
+            errors.append(error)
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        # Hold the loop thread so the lookup is still queued when stop() runs.
+        loop.loop.call_soon_threadsafe(time.sleep, 0.1)
+        thread = threading.Thread(target=lookup)
+        thread.start()
+        time.sleep(0.05)
+        loop.stop()
+        thread.join()
+        gc.collect()
+    assert [str(error) for error in errors] == ["BackgroundLoop stopped"]
+    assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
+
+def test_sync_client_lookup_started_during_shutdown(loop):
+    client = SyncClient(CountingSignatureLookup(SIGNATURES), loop=loop)
+    errors = []
+
+    class LateLookup:
+        # Closed while the loop shuts down, i.e. after stop() has returned
+        # control to the loop thread but before the loop is closed.
+        async def aclose(self):
+            try:
+                await client._load_functions("0x06fdde03")
+            except Exception as error:
+                errors.append(error)
+
+    late = LateLookup()
+
+    async def register():
+        loop.register(late)
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        loop.run(register())
+        loop.stop()
+        gc.collect()
+    assert [str(error) for error in errors] == ["BackgroundLoop stopped"]
+    assert client._session is None
+    assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+import pytest
+from whatsabi.concurrency import BackgroundLoop
+
+
+async def current_thread_name():
+    await asyncio.sleep(0)
+    return threading.current_thread().name
+
+
+def test_background_loop_runs_coroutines_off_thread():
+    loop = BackgroundLoop()
+    try:
+        assert loop.run(current_thread_name()) == "whatsabi-loop"
+    finally:
+        loop.stop()
+
+
+def test_background_loop_shared_between_threads():
+    loop = BackgroundLoop()
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            names = list(pool.map(lambda _: loop.run(current_thread_name()), range(32)))
+        assert set(names) == {"whatsabi-loop"}
+    finally:
+        loop.stop()
+
+
+def test_background_loop_timeout():
+    loop = BackgroundLoop()
+    try:
+        with pytest.raises(TimeoutError):
+            loop.run(asyncio.sleep(10), timeout=0.01)
+    finally:
+        loop.stop()
+
+
+def test_background_loop_rejects_reentrant_run():
+    loop = BackgroundLoop()
+
+    async def reenter():
+        loop.run(asyncio.sleep(0))
+
+    try:
+        with pytest.raises(RuntimeError):
+            loop.run(reenter())
+    finally:
+        loop.stop()
+
+
+def test_background_loop_restarts_after_stop():
+    loop = BackgroundLoop()
+    loop.run(asyncio.sleep(0))
+    loop.stop()
+    assert loop.run(current_thread_name()) == "whatsabi-loop"
+    loop.stop()
+
+
+def test_background_loop_closes_registered_on_stop():
+    loop = BackgroundLoop()
+
+    class Closeable:
+        closed = False
+
+        async def aclose(self):
+            self.closed = True
+
+    closeable = Closeable()
+
+    async def register():
+        loop.register(closeable)
+
+    loop.run(register())
+    loop.stop()
+    assert closeable.closed
+
+
+def test_background_loop_run_fails_fast_on_stopped_loop():
+    loop = BackgroundLoop()
+    loop.run(asyncio.sleep(0))
+    # Hold the loop thread so that the stop and the submission below are
+    # queued together, as when run() races with a concurrent stop().
+    loop.loop.call_soon_threadsafe(time.sleep, 0.1)
+    loop.loop.call_soon_threadsafe(loop.loop.stop)
+    with pytest.raises(RuntimeError):
+        loop.run(asyncio.sleep(0), timeout=5)
+    assert loop.run(current_thread_name(), timeout=5) == "whatsabi-loop"
+    loop.stop()
@@ -1,5 +1,6 @@
 import pytest
 from whatsabi.loaders import (
+    SignatureLookup,
     EtherscanLoader,
     SourcifyABILoader,
     FourByteSignatureLookup,
@@ -88,3 +89,20 @@ async def test_multi_signature_lookup():
         "0x721c20121297512b72821b97f5326877ea8ecf4bb9948fea5bfcb6453074d37f"
     )
     assert "CounterIncremented(uint256,address)" in event_signatures
+
+
+class SessionlessSignatureLookup(SignatureLookup):
+    async def load_functions(self, selector):
+        return ["name()"]
+
+    async def load_events(self, hash):
+        return ["CounterIncremented(uint256,address)"]
+
+
+@pytest.mark.asyncio
+async def test_multi_signature_lookup_without_session_support():
+    multi_signature_lookup = MultiSignatureLookup([SessionlessSignatureLookup()])
+    assert await multi_signature_lookup.load_functions("0x06fdde03") == ["name()"]
+    assert await multi_signature_lookup.load_events(
+        "0x721c20121297512b72821b97f5326877ea8ecf4bb9948fea5bfcb6453074d37f"
+    ) == ["CounterIncremented(uint256,address)"]
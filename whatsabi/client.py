@@ -0,0 +1,153 @@
+import asyncio
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+import aiohttp
+from .concurrency import BackgroundLoop, background_loop
+from .loaders import ABILoader, SignatureLookup
+
+
+class SyncClient:
+    """Blocking facade over the async loaders, safe to share between threads.
+
+    Every call is submitted to a single long-lived event loop running on a
+    background thread, so callers never need a loop of their own. The client
+    owns one `aiohttp.ClientSession` on that loop and passes it to its loaders
+    on each call, which lets all callers reuse pooled connections. Results are
+    kept in an LRU cache of up to `max_cache_size` entries (0 disables it), and
+    concurrent lookups of the same key share a single request.
+    """
+
+    lookup: Optional[SignatureLookup]
+    abi_loader: Optional[ABILoader]
+
+    def __init__(
+        self,
+        lookup: Optional[SignatureLookup] = None,
+        abi_loader: Optional[ABILoader] = None,
+        loop: Optional[BackgroundLoop] = None,
+        timeout: Optional[float] = None,
+        max_cache_size: int = 1024,
+    ) -> None:
+        self.lookup = lookup
+        self.abi_loader = abi_loader
+        self.timeout = timeout
+        self.max_cache_size = max_cache_size
+        self._loop = loop or background_loop()
+        # Only ever touched from the loop thread, so no locking is needed.
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._cache: "OrderedDict[Any, asyncio.Future]" = OrderedDict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def load_functions(self, selector: str) -> List[str]:
+        return self._run(self._load_functions(selector))
+
+    def load_events(self, hash: str) -> List[str]:
+        return self._run(self._load_events(hash))
+
+    def load_abi(self, address: str):
+        return self._run(self._load_abi(address))
+
+    def load_functions_many(self, selectors: Iterable[str]) -> Dict[str, List[str]]:
+        return self._run(self._load_many(self._load_functions, selectors))
+
+    def load_events_many(self, hashes: Iterable[str]) -> Dict[str, List[str]]:
+        return self._run(self._load_many(self._load_events, hashes))
+
+    def clear_cache(self):
+        self._run(self._clear_cache())
+
+    def close(self):
+        """Close the pooled session. The shared loop keeps running."""
+        session = self._session
+        if session is None or session.closed:
+            return
+        self._loop.run(self.aclose())
+
+    async def aclose(self):
+        if self._session is not None:
+            session, self._session = self._session, None
+            await session.close()
+
+    def _run(self, coro):
+        return self._loop.run(coro, self.timeout)
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session_loop is not loop:
+            # The BackgroundLoop was restarted; the session and any cached
+            # tasks belonged to the old loop and can't be used on this one.
+            self._session = None
+            self._session_loop = loop
+            self._cache.clear()
+        if self._session is None or self._session.closed:
+            session = aiohttp.ClientSession()
+            try:
+                self._loop.register(self)
+            except RuntimeError:
+                await session.close()
+                raise
+            self._session = session
+        return self._session
+
+    async def _cached(self, key, factory):
+        session = await self._ensure_session()
+        task = self._cache.get(key)
+        if task is not None:
+            self._cache.move_to_end(key)
+        else:
+            task = asyncio.ensure_future(factory(session))
+            if self.max_cache_size > 0:
+                self._cache[key] = task
+                while len(self._cache) > self.max_cache_size:
+                    self._cache.popitem(last=False)
+
+                def evict_failed(task):
+                    if task.cancelled() or task.exception() is not None:
+                        if self._cache.get(key) is task:
+                            del self._cache[key]
+
+                task.add_done_callback(evict_failed)
+        # Shield the shared task so one caller timing out doesn't cancel it
+        # for everyone else waiting on the same key.
+        result = await asyncio.shield(task)
+        return list(result) if isinstance(result, list) else result
+
+    async def _load_functions(self, selector):
+        if self.lookup is None:
+            raise ValueError("SyncClient has no signature lookup configured")
+        selector = selector.lower()
+        return await self._cached(
+            ("function", selector),
+            lambda session: self.lookup.load_functions(selector, session=session),
+        )
+
+    async def _load_events(self, hash):
+        if self.lookup is None:
+            raise ValueError("SyncClient has no signature lookup configured")
+        hash = hash.lower()
+        return await self._cached(
+            ("event", hash),
+            lambda session: self.lookup.load_events(hash, session=session),
+        )
+
+    async def _load_abi(self, address):
+        if self.abi_loader is None:
+            raise ValueError("SyncClient has no ABI loader configured")
+        return await self._cached(
+            ("abi", address.lower()),
+            lambda session: self.abi_loader.load_abi(address, session=session),
+        )
+
+    async def _load_many(self, load, keys):
+        keys = list(keys)
+        results = await asyncio.gather(*[load(key) for key in keys])
+        return dict(zip(keys, results))
+
+    async def _clear_cache(self):
+        self._cache.clear()
@@ -1,6 +1,11 @@
 import asyncio
+import atexit
+import concurrent.futures
 import signal
+import threading
+import weakref
 from functools import wraps
+from typing import Optional
 
 
 def coro(f):
@@ -20,3 +25,157 @@ def coro(f):
             loop.run_until_complete(loop.shutdown_asyncgens())
 
     return wrapper
+
+
+class _LoopState:
+    """One run of a BackgroundLoop: its loop, thread and outstanding work."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread: Optional[threading.Thread] = None
+        self.futures = set()
+        self.closeables = weakref.WeakSet()
+        self.stopping = False
+
+
+class BackgroundLoop:
+    """An event loop running forever on a daemon thread.
+
+    Coroutines can be submitted from any thread with `run`, which blocks the
+    calling thread until the result is ready. The loop thread is started
+    lazily on first use, and again after `stop`.
+
+    Objects with an async `aclose()` method can be registered from the loop
+    thread; they are closed on that loop before it shuts down.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state: Optional[_LoopState] = None
+        # The state of the loop running on the current thread, if any.
+        self._local = threading.local()
+
+    def _current(self) -> _LoopState:
+        # Must be called with self._lock held.
+        if self._state is None or self._state.stopping:
+            state = _LoopState()
+            state.thread = threading.Thread(
+                target=self._run_forever,
+                args=(state,),
+                name="whatsabi-loop",
+                daemon=True,
+            )
+            state.thread.start()
+            self._state = state
+        return self._state
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            return self._current().loop
+
+    def _run_forever(self, state: _LoopState):
+        loop = state.loop
+        asyncio.set_event_loop(loop)
+        self._local.state = state
+        try:
+            loop.run_forever()
+        finally:
+            with self._lock:
+                state.stopping = True
+            try:
+                _cancel_all_tasks(loop)
+                closers = [closeable.aclose() for closeable in list(state.closeables)]
+                loop.run_until_complete(
+                    asyncio.gather(*closers, return_exceptions=True)
+                )
+                # Work queued between loop.stop() and `stopping` being set only
+                # started running above; cancel it too.
+                _cancel_all_tasks(loop)
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            finally:
+                loop.close()
+                with self._lock:
+                    futures = list(state.futures)
+                # Work that was scheduled while the loop was stopping never
+                # ran; fail it so callers don't block forever.
+                for future in futures:
+                    _fail_stopped(future)
+
+    def register(self, closeable):
+        """Close `closeable` when the loop it is registered on stops."""
+        state = getattr(self._local, "state", None)
+        if state is None:
+            raise RuntimeError("BackgroundLoop.register() must run on its loop")
+        with self._lock:
+            if state.stopping:
+                raise RuntimeError("BackgroundLoop stopped")
+            state.closeables.add(closeable)
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        return self._submit(coro)[1]
+
+    def _submit(self, coro):
+        with self._lock:
+            # _current() never hands out a stopping loop, and `stopping` is
+            # only set under this lock, so the loop accepts this work.
+            state = self._current()
+            future = asyncio.run_coroutine_threadsafe(coro, state.loop)
+            state.futures.add(future)
+
+        def discard(future):
+            with self._lock:
+                state.futures.discard(future)
+
+        future.add_done_callback(discard)
+        return state, future
+
+    def run(self, coro, timeout: Optional[float] = None):
+        if getattr(self._local, "state", None) is not None:
+            coro.close()
+            raise RuntimeError("BackgroundLoop.run() called from its own loop thread")
+        state, future = self._submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+        except concurrent.futures.CancelledError:
+            if state.stopping:
+                raise RuntimeError("BackgroundLoop stopped") from None
+            raise
+
+    def stop(self):
+        with self._lock:
+            state, self._state = self._state, None
+        if state is None:
+            return
+        try:
+            state.loop.call_soon_threadsafe(state.loop.stop)
+        except RuntimeError:
+            pass  # the loop already stopped and closed on its own
+        if state.thread is not threading.current_thread():
+            state.thread.join()
+
+
+def _cancel_all_tasks(loop: asyncio.AbstractEventLoop):
+    tasks = asyncio.all_tasks(loop)
+    for task in tasks:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+
+def _fail_stopped(future: concurrent.futures.Future):
+    try:
+        future.set_exception(RuntimeError("BackgroundLoop stopped"))
+    except concurrent.futures.InvalidStateError:
+        pass
+
+
+_background_loop = BackgroundLoop()
+atexit.register(_background_loop.stop)
+
+
+def background_loop() -> BackgroundLoop:
+    """The process-wide loop shared by all sync clients by default."""
+    return _background_loop
@@ -1,13 +1,22 @@
-from typing import List
+from typing import List, Optional
 import aiohttp
 import asyncio
 from web3 import Web3
 from abc import ABC, abstractclassmethod
 
 
+async def fetch_json(url: str, session: Optional[aiohttp.ClientSession] = None):
+    if session is not None:
+        async with session.get(url) as resp:
+            return await resp.json()
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url) as resp:
+            return await resp.json()
+
+
 class ABILoader(ABC):
     @abstractclassmethod
-    def load_abi(self, address):
+    def load_abi(self, address, session=None):
         pass
 
 
@@ -19,7 +28,7 @@ class EtherscanLoader(ABILoader):
         self.api_key = config.get("api_key", "")
         self.base_url = config.get("base_url", "https://api.etherscan.io/api")
 
-    async def load_abi(self, address):
+    async def load_abi(self, address, session: Optional[aiohttp.ClientSession] = None):
         url = (
             self.base_url
             + "?module=contract&action=getabi&address="
@@ -27,31 +36,27 @@ class EtherscanLoader(ABILoader):
             + "&apikey="
             + self.api_key
         )
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                data = await resp.json()
-                return data["result"]
+        data = await fetch_json(url, session)
+        return data["result"]
 
 
 class SourcifyABILoader(ABILoader):
     base_url: str = "https://repo.sourcify.dev/contracts/partial_match/1/"
 
-    async def load_abi(self, address):
+    async def load_abi(self, address, session: Optional[aiohttp.ClientSession] = None):
         address = Web3.toChecksumAddress(address)
         url = self.base_url + address + "/metadata.json"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                data = await resp.json()
-                return data["output"]["abi"]
+        data = await fetch_json(url, session)
+        return data["output"]["abi"]
 
 
 class SignatureLookup(ABC):
     @abstractclassmethod
-    def load_functions(self, selector) -> List[str]:
+    def load_functions(self, selector, session=None) -> List[str]:
         pass
 
     @abstractclassmethod
-    def load_events(self, hash) -> List[str]:
+    def load_events(self, hash, session=None) -> List[str]:
         pass
 
 
@@ -59,21 +64,21 @@ class SamczsunSignatureLookup(SignatureLookup):
     function_base_url: str = "https://sig.eth.samczsun.com/api/v1/signatures?function="
     event_base_url: str = "https://sig.eth.samczsun.com/api/v1/signatures?event="
 
-    async def load(self, url: str):
+    async def load(self, url: str, session: Optional[aiohttp.ClientSession] = None):
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as resp:
-                    data = await resp.json()
-                    return data["result"]
+            data = await fetch_json(url, session)
+            return data["result"]
         except Exception as error:
             raise error
 
-    async def load_functions(self, selector):
-        result = await self.load(self.function_base_url + selector)
+    async def load_functions(
+        self, selector, session: Optional[aiohttp.ClientSession] = None
+    ):
+        result = await self.load(self.function_base_url + selector, session)
         return [signature["name"] for signature in result["function"][selector]]
 
-    async def load_events(self, hash):
-        result = await self.load(self.event_base_url + hash)
+    async def load_events(self, hash, session: Optional[aiohttp.ClientSession] = None):
+        result = await self.load(self.event_base_url + hash, session)
         return [signature["name"] for signature in result["event"][hash]]
 
 
@@ -85,21 +90,21 @@ class FourByteSignatureLookup(SignatureLookup):
         "https://www.4byte.directory/api/v1/event-signatures/?hex_signature="
     )
 
-    async def load(self, url: str):
+    async def load(self, url: str, session: Optional[aiohttp.ClientSession] = None):
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as resp:
-                    data = await resp.json()
-                    return data["results"]
+            data = await fetch_json(url, session)
+            return data["results"]
         except Exception as error:
             raise error
 
-    async def load_functions(self, selector):
-        result = await self.load(self.function_base_url + selector)
+    async def load_functions(
+        self, selector, session: Optional[aiohttp.ClientSession] = None
+    ):
+        result = await self.load(self.function_base_url + selector, session)
         return [signature["text_signature"] for signature in result]
 
-    async def load_events(self, hash):
-        result = await self.load(self.event_base_url + hash)
+    async def load_events(self, hash, session: Optional[aiohttp.ClientSession] = None):
+        result = await self.load(self.event_base_url + hash, session)
         return [signature["text_signature"] for signature in result]
 
 
@@ -109,15 +114,21 @@ class MultiSignatureLookup(SignatureLookup):
     def __init__(self, lookups) -> None:
         self.lookups = lookups
 
-    async def load_functions(self, selector):
-        tasks = [lookup.load_functions(selector) for lookup in self.lookups]
+    async def load_functions(
+        self, selector, session: Optional[aiohttp.ClientSession] = None
+    ):
+        # Only pass the session along when set, so subclasses that don't
+        # accept one keep working in plain async use.
+        kwargs = {} if session is None else {"session": session}
+        tasks = [lookup.load_functions(selector, **kwargs) for lookup in self.lookups]
         signatures = await asyncio.gather(*tasks)
         return list(
             set([sig for sub_signatures in signatures for sig in sub_signatures])
         )
 
-    async def load_events(self, hash):
-        tasks = [lookup.load_events(hash) for lookup in self.lookups]
+    async def load_events(self, hash, session: Optional[aiohttp.ClientSession] = None):
+        kwargs = {} if session is None else {"session": session}
+        tasks = [lookup.load_events(hash, **kwargs) for lookup in self.lookups]
         signatures = await asyncio.gather(*tasks)
         return list(
             set([sig for sub_signatures in signatures for sig in sub_signatures])